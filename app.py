@@ -12,7 +12,7 @@ from classes.pdf_text_extractor import PDFTextExtractor
 from classes.transcript_processor import TranscriptProcessor
 from classes.edge_tts_generator import EdgeTTSGenerator
 
-from config import llm_configs
+from config import llm_configs, audio_output_configs, default_audio_output_format
 
 def create_temp_session_directory():
     return tempfile.mkdtemp()
@@ -63,7 +63,7 @@ def process_pdf_to_podcast(pdf_file, model_name, max_chars=100000, chunk_size=10
         # error_message += "\n" + traceback.format_exc()
         return error_message, None, None, None, None
 
-def generate_audio_from_modified_text(tts_ready_text, session_dir):
+def generate_audio_from_modified_text(tts_ready_text, session_dir, audio_format=default_audio_output_format):
     try:
         if not session_dir:
             session_dir = create_temp_session_directory()
@@ -74,7 +74,7 @@ def generate_audio_from_modified_text(tts_ready_text, session_dir):
         with open(tts_ready_path, 'wb') as f:
             pickle.dump(tts_ready_text, f)
         
-        tts_gen = EdgeTTSGenerator(tts_ready_path, audio_output_path)
+        tts_gen = EdgeTTSGenerator(tts_ready_path, audio_output_path, output_format=audio_format)
         audio_path = asyncio.run(tts_gen.generate_audio())
         return "Step 4 completed successfully. Audio saved.", audio_path
     except Exception as e:
@@ -83,6 +83,39 @@ def generate_audio_from_modified_text(tts_ready_text, session_dir):
         # error_message += "\n" + traceback.format_exc()
         return error_message, None
 
+def compare_audio_formats(tts_ready_text, session_dir):
+    try:
+        if not session_dir:
+            session_dir = create_temp_session_directory()
+        
+        tts_ready_path = os.path.join(session_dir, "podcast_ready_data.pkl")
+        audio_output_path = os.path.join(session_dir, "format_comparison", "podcast_audio.mp3")
+        os.makedirs(os.path.dirname(audio_output_path), exist_ok=True)
+        
+        with open(tts_ready_path, 'wb') as f:
+            pickle.dump(tts_ready_text, f)
+        
+        tts_gen = EdgeTTSGenerator(tts_ready_path, audio_output_path)
+        report = asyncio.run(tts_gen.compare_output_formats())
+        
+        baseline_size = next((row["size_bytes"] for row in report if row["format"] == default_audio_output_format), None)
+        lines = [
+            "| Format | Size (KB) | Size vs default | Synthesis (s) | Encoding (s) | Total (s) |",
+            "|---|---|---|---|---|---|",
+        ]
+        for row in report:
+            relative_size = f"{row['size_bytes'] / baseline_size:.0%}" if baseline_size else "-"
+            lines.append(
+                f"| {row['format']} | {row['size_bytes'] / 1024:.1f} | {relative_size} | "
+                f"{row['synthesis_seconds']:.2f} | {row['encode_seconds']:.2f} | {row['total_seconds']:.2f} |"
+            )
+        return "Format comparison completed successfully.", "\n".join(lines)
+    except Exception as e:
+        error_message = f"An error occurred during format comparison: {str(e)}"
+        # Optionally, include traceback for debugging (comment out in production)
+        # error_message += "\n" + traceback.format_exc()
+        return error_message, None
+
 # Gradio Interface with Informative Descriptions and Multi-page Layout
 custom_theme = gr.themes.Default(
     primary_hue="purple",
@@ -146,6 +179,11 @@ with gr.Blocks(theme=custom_theme) as app:
         Users can make final adjustments to the text here to ensure accuracy and coherence before audio generation.
         """)
         tts_ready_preview = gr.Textbox(label="Editable Rewritten Transcript for TTS", interactive=True, lines=10)
+        audio_format = gr.Dropdown(
+            label="Audio Output Format",
+            choices=list(audio_output_configs.keys()),
+            value=default_audio_output_format
+        )
         generate_audio_button = gr.Button("Generate Audio from Edited Transcript")
     # Page 5: Listen to Generated Podcast Audio
     with gr.Tab("Audio Output"):
@@ -153,7 +191,13 @@ with gr.Blocks(theme=custom_theme) as app:
         ## Audio Output
        Your transformed audio is now ready! Listen to your research in a podcast-like format, perfect for accessible and engaging learning on-the-go.
         """)
-        final_audio_output = gr.Audio(label="Generated Podcast Audio")
+        final_audio_output = gr.Audio(label="Generated Podcast Audio", type="filepath")
+        gr.Markdown("""
+        ### Compare Output Formats
+        Synthesizes the edited transcript once and saves it in every available format, reporting file size and generation time for each.
+        """)
+        compare_formats_button = gr.Button("Compare Output Formats")
+        format_report = gr.Markdown()
     
     session_dir = gr.State()
     # Execute Steps 1-3: Upload, Process, Extract
@@ -165,8 +209,14 @@ with gr.Blocks(theme=custom_theme) as app:
     # Step 4: Generate Audio from Edited Transcript
     generate_audio_button.click(
         generate_audio_from_modified_text, 
-        inputs=[tts_ready_preview, session_dir],
+        inputs=[tts_ready_preview, session_dir, audio_format],
         outputs=[output_status, final_audio_output]
     )
+    # Compare file size and generation time across audio output formats
+    compare_formats_button.click(
+        compare_audio_formats,
+        inputs=[tts_ready_preview, session_dir],
+        outputs=[output_status, format_report]
+    )
 
 app.launch()
@@ -1,26 +1,38 @@
 # classes/edge_tts_generator.py
 
 import asyncio
+import os
 import pickle
 import re
+import shutil
+import subprocess
+import time
 from tqdm import tqdm
 import ast
 import edge_tts
 
+from config import audio_output_configs, default_audio_output_format
+
 class EdgeTTSGenerator:
     """
     A class to generate podcast-style audio from a transcript using edge-tts.
     """
-    def __init__(self, transcript_file_path, output_audio_path):
+    def __init__(self, transcript_file_path, output_audio_path, output_format=default_audio_output_format):
         """
         Initialize the TTS generator with the path to the rewritten transcript file.
         
         Args:
             transcript_file_path (str): Path to the file containing the rewritten transcript.
-            output_audio_path (str): Path to save the generated audio file.
+            output_audio_path (str): Path to save the generated audio file. The extension is
+                replaced with the one matching the output format.
+            output_format (str): Name of the audio format in audio_output_configs.
         """
         self.transcript_file_path = transcript_file_path
         self.output_audio_path = output_audio_path
+        self.output_format = output_format
+
+        if output_format not in audio_output_configs:
+            raise ValueError(f"Audio output format {output_format} not found in audio_output_configs.")
 
         # Speaker descriptions for edge-tts voices
         self.speaker1_voice = "en-US-AriaNeural"
@@ -48,22 +60,87 @@ class EdgeTTSGenerator:
             bytes: Generated audio data.
         """
         communicator = edge_tts.Communicate(text, voice_name)
-        audio_bytes = b""
+        audio_chunks = []
         async for chunk in communicator.stream():
             if "data" in chunk:  # Check if 'data' exists in chunk
-                audio_bytes += chunk["data"]  # Concatenate only the audio data
-        return audio_bytes
+                audio_chunks.append(chunk["data"])  # Collect only the audio data
+        return b"".join(audio_chunks)
+
+    async def synthesize_transcript(self):
+        """
+        Synthesizes every transcript segment with the matching speaker voice.
+        
+        Returns:
+            list: List of bytes containing the raw MP3 audio data for each segment.
+        """
+        transcript = self.load_transcript()
+        audio_data = []
+
+        for speaker, text in tqdm(transcript, desc="Generating podcast segments", unit="segment"):
+            voice = self.speaker1_voice if speaker == "Speaker 1" else self.speaker2_voice
+            segment_audio = await self.generate_audio_segment(text, voice)
+            audio_data.append(segment_audio)
+
+        return audio_data
+
+    def get_output_path(self, output_format):
+        """
+        Returns the output path with the extension of the given audio format.
+        """
+        extension = audio_output_configs[output_format]["extension"]
+        return f"{os.path.splitext(self.output_audio_path)[0]}.{extension}"
+
+    def build_ffmpeg_command(self, output_format, output_path):
+        """
+        Builds the ffmpeg command that encodes the raw edge-tts MP3 stream read from stdin.
+        
+        Args:
+            output_format (str): Name of the audio format in audio_output_configs.
+            output_path (str): Path to write the encoded audio to.
+        
+        Returns:
+            list: The ffmpeg command line.
+        """
+        format_config = audio_output_configs[output_format]
+        command = ["ffmpeg", "-y", "-hide_banner", "-loglevel", "error", "-f", "mp3", "-i", "pipe:0", "-vn"]
+        command += ["-c:a", format_config["codec"]]
+
+        if format_config["codec"] != "copy":
+            command += ["-b:a", format_config["bitrate"]]
+            command += ["-ar", str(format_config["sample_rate"])]
+            command += ["-ac", str(format_config["channels"])]
 
-    def save_audio(self, audio_data):
+        command += format_config.get("extra_args", [])
+        command.append(output_path)
+        return command
+
+    def save_audio(self, audio_data, output_format=None):
         """
-        Save the combined audio data to an output file.
+        Save the combined audio data to an output file in the requested format.
         
         Args:
             audio_data (list): List of bytes containing the audio data for each segment.
+            output_format (str): Name of the audio format, defaults to the generator's format.
+        
+        Returns:
+            str: Path to the saved audio file.
         """
+        output_format = output_format or self.output_format
+        output_path = self.get_output_path(output_format)
         combined_audio = b"".join(audio_data)
-        with open(self.output_audio_path, "wb") as f:
-            f.write(combined_audio)
+
+        if shutil.which("ffmpeg") is None:
+            if audio_output_configs[output_format]["codec"] != "copy":
+                raise RuntimeError(f"ffmpeg is required to encode audio as {output_format}.")
+            # Without ffmpeg, fall back to the bare concatenated MP3 frames
+            with open(output_path, "wb") as f:
+                f.write(combined_audio)
+            return output_path
+
+        result = subprocess.run(self.build_ffmpeg_command(output_format, output_path), input=combined_audio, capture_output=True)
+        if result.returncode != 0:
+            raise RuntimeError(f"ffmpeg failed to encode audio as {output_format}: {result.stderr.decode(errors='replace').strip()}")
+        return output_path
 
     async def generate_audio(self):
         """
@@ -72,13 +149,37 @@ class EdgeTTSGenerator:
         Returns:
             str: Path to the saved audio file.
         """
-        transcript = self.load_transcript()
-        audio_data = []
+        audio_data = await self.synthesize_transcript()
+        return self.save_audio(audio_data)
 
-        for speaker, text in tqdm(transcript, desc="Generating podcast segments", unit="segment"):
-            voice = self.speaker1_voice if speaker == "Speaker 1" else self.speaker2_voice
-            segment_audio = await self.generate_audio_segment(text, voice)
-            audio_data.append(segment_audio)
+    async def compare_output_formats(self, output_formats=None):
+        """
+        Synthesizes the transcript once and saves it in each format to compare size and time.
+        
+        Args:
+            output_formats (list): Names of the formats to compare, defaults to all of them.
+        
+        Returns:
+            list: One dict per format with the output path, file size and timings in seconds.
+        """
+        output_formats = output_formats or list(audio_output_configs.keys())
+
+        start = time.perf_counter()
+        audio_data = await self.synthesize_transcript()
+        synthesis_seconds = time.perf_counter() - start
+
+        report = []
+        for output_format in output_formats:
+            start = time.perf_counter()
+            output_path = self.save_audio(audio_data, output_format)
+            encode_seconds = time.perf_counter() - start
 
-        self.save_audio(audio_data)
-        return self.output_audio_path
+            report.append({
+                "format": output_format,
+                "path": output_path,
+                "size_bytes": os.path.getsize(output_path),
+                "synthesis_seconds": synthesis_seconds,
+                "encode_seconds": encode_seconds,
+                "total_seconds": synthesis_seconds + encode_seconds
+            })
+        return report
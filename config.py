@@ -52,3 +52,52 @@ llm_configs = {
         }
     }
 }
+
+# Audio output formats for the generated podcast.
+# edge-tts always streams 24kHz / 48kbit/s mono MP3; every entry below is produced
+# from that stream with ffmpeg, which also writes proper container headers so the
+# file reports its duration and supports seeking / range requests.
+audio_output_configs = {
+    # Edge TTS stream remuxed as-is (no re-encoding, adds Xing/Info header)
+    "mp3-48k-mono": {
+        "codec": "copy",
+        "extension": "mp3"
+    },
+    "mp3-32k-mono": {
+        "codec": "libmp3lame",
+        "bitrate": "32k",
+        "sample_rate": 22050,
+        "channels": 1,
+        "extension": "mp3"
+    },
+
+    # Opus is tuned for speech and stays intelligible at very low bitrates
+    "opus-24k-mono": {
+        "codec": "libopus",
+        "bitrate": "24k",
+        "sample_rate": 24000,
+        "channels": 1,
+        "extension": "ogg",
+        "extra_args": ["-application", "voip"]
+    },
+    "opus-16k-mono": {
+        "codec": "libopus",
+        "bitrate": "16k",
+        "sample_rate": 16000,
+        "channels": 1,
+        "extension": "ogg",
+        "extra_args": ["-application", "voip"]
+    },
+
+    # AAC in MP4 with the index at the front for progressive playback
+    "aac-32k-mono": {
+        "codec": "aac",
+        "bitrate": "32k",
+        "sample_rate": 24000,
+        "channels": 1,
+        "extension": "m4a",
+        "extra_args": ["-movflags", "+faststart"]
+    }
+}
+
+default_audio_output_format = "mp3-48k-mono"